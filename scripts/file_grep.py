@@ -1,11 +1,18 @@
+import mmap
 import re
 from pathlib import Path
 
 keywords = ["moldova", "luxembourg", "norway"]
-pat = re.compile("|".join(re.escape(k) for k in keywords), re.I)
+# One pre-encoded pattern per keyword: a plain literal search over bytes
+# uses re's fast literal scanner and stops at the first occurrence.
+pats = [re.compile(re.escape(k.encode()), re.I) for k in keywords]
 
 for f in Path.cwd().glob("*.json"):
-    text = f.read_text()
-    matches = {m.lower() for m in pat.findall(text)}
-    if all(k in matches for k in keywords):
-        print(f.name)
+    if f.stat().st_size == 0:
+        continue
+    # Memory-map and scan raw bytes: no whole-file read, no UTF-8 decode.
+    # Each keyword search ends at its first hit; the first absent keyword
+    # short-circuits the rest.
+    with f.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if all(p.search(mm) for p in pats):
+            print(f.name)
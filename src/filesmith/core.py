@@ -49,13 +49,43 @@ def _get_mtime_threshold(newermt_value):
             )
 
 
+def _walk_files(root):
+    """
+    Yield os.DirEntry objects for all files under `root`, depth-first.
+
+    Uses os.scandir so each entry's cached stat result serves both the
+    file-type check and any later mtime comparison without extra
+    syscalls. Like os.walk, symlinked directories are not entered and
+    unreadable directories are skipped.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(entry.path)
+        elif entry.is_file():
+            yield entry
+
+
+# Destinations already confirmed (or created) by this process, so tight
+# wrapper loops over copy_files skip the per-call isdir stat.
+_ensured_destinations: set[str] = set()
+
+
 def _ensure_destination_exists(destination, dry_run):
+    key = os.fspath(destination)
+    if key in _ensured_destinations:
+        return
     if os.path.isdir(destination):
+        _ensured_destinations.add(key)
         return
     if dry_run:
         logging.info("(Dry Run) Would create destination directory: %s", destination)
     else:
         os.makedirs(destination)
+        _ensured_destinations.add(key)
 
 
 def _copy_file_action(source_path, destination_path, dry_run, quiet):
@@ -87,20 +117,21 @@ def copy_files(origin, destination, pattern, newermt=None, dry_run=False, quiet=
 
     selected_files: list[Path] = []
 
+    # Compile the filename regex once instead of re-resolving it per file.
+    pat = re.compile(pattern)
+
     # Keep existing behavior:
-    # - Walk the directory tree with os.walk
+    # - Walk the directory tree (scandir-based, one stat per entry)
     # - Filter filenames by regex (`pattern`)
     # - Apply mtime threshold if provided
-    for dirpath, _, filenames in os.walk(origin_path):
-        for filename in filenames:
-            if not re.search(pattern, filename):
-                continue
+    for entry in _walk_files(origin_path):
+        if not pat.search(entry.name):
+            continue
 
-            source_path = Path(dirpath) / filename
-            if mtime_threshold and source_path.stat().st_mtime <= mtime_threshold:
-                continue
+        if mtime_threshold and entry.stat().st_mtime <= mtime_threshold:
+            continue
 
-            selected_files.append(source_path)
+        selected_files.append(Path(entry.path))
 
     if not selected_files:
         return
@@ -137,15 +168,25 @@ def get_target_file(src_dir: str | Path, target_key: str, ext: str | None = None
     if not src.exists() or not src.is_dir():
         raise ValueError(f"Directory not found: {src}")
 
-    pattern = f"*{ext}" if ext else "*"
-    files = [p for p in sorted(src.glob(pattern)) if target_key in p.name]
+    # Single scandir pass with substring/suffix checks on the raw names;
+    # stop as soon as a second hit proves the key is ambiguous.
+    files: list[Path] = []
+    with os.scandir(src) as it:
+        for entry in it:
+            if target_key not in entry.name:
+                continue
+            if ext and not entry.name.endswith(ext):
+                continue
+            files.append(Path(entry.path))
+            if len(files) > 1:
+                break
 
     if len(files) == 0:
         raise ValueError(f"No file found with key={target_key!r} in {src}")
     if len(files) > 1:
         raise ValueError(
             f"Multiple files found with key={target_key!r} in {src}:\n" +
-            "\n".join(str(f) for f in files)
+            "\n".join(str(f) for f in sorted(files))
         )
 
     return files[0]
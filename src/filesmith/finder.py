@@ -13,21 +13,61 @@ Future extensions may include:
 """
 
 from __future__ import annotations
+import os
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 PathPredicate = Callable[[Path], bool]
 
 
+def _scandir_files(root: Path | str, recursive: bool) -> Iterator[Path]:
+    """
+    Yield all files under `root` using os.scandir.
+
+    Mirrors pathlib glob/rglob semantics for "*"-style patterns:
+    symlinked directories are not descended into, and unreadable or
+    missing directories are silently ignored.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from _scandir_files(entry.path, recursive)
+        elif entry.is_file():
+            yield Path(entry.path)
+
+
+def _literal_suffix(pattern: str) -> Optional[str]:
+    """
+    Return the suffix for "*<literal>" patterns (e.g. ".txt" for "*.txt"),
+    or None if the pattern needs real glob matching.
+    """
+    if pattern == "*":
+        return ""
+    if pattern.startswith("*") and not any(c in pattern[1:] for c in "*?["):
+        return pattern[1:]
+    return None
+
+
 def find_files(
     root: Path,
     pattern: str = "*",
     recursive: bool = True,
     predicate: Optional[PathPredicate] = None,
-) -> list[Path]:
+) -> Iterator[Path]:
     """
     Find files under `root` using glob or rglob and optional filtering.
 
+    Files are yielded lazily as the tree is walked, so consumers see the
+    first match without waiting for the full walk and the pipeline runs
+    in bounded memory. Wrap the result in list() if you need len() or
+    indexing.
+
     Parameters
     ----------
     root : Path
@@ -39,23 +79,39 @@ def find_files(
     predicate : Callable[[Path], bool], optional
         Optional per-file test. If provided, keep only files where predicate(file) is True.
 
-    Returns
-    -------
-    list[Path]
+    Yields
+    ------
+    Path
         Matching files.
     """
 
     root = Path(root).expanduser()
 
+    # Fast path for "*" and "*<literal>" patterns (including the "*"
+    # default used by FindMoveJob): a plain scandir walk plus an
+    # endswith check, with no per-entry fnmatch work.
+    suffix = _literal_suffix(pattern)
+    if suffix is not None:
+        walk = _scandir_files(root, recursive)
+        if not suffix and predicate is None:
+            # Match-everything case (FindMoveJob's default): the walk IS
+            # the result, so stream it with no per-file filter layer.
+            yield from walk
+            return
+        for p in walk:
+            if suffix and not p.name.endswith(suffix):
+                continue
+            if predicate and not predicate(p):
+                continue
+            yield p
+        return
+
     iterator: Iterable[Path]
     iterator = root.rglob(pattern) if recursive else root.glob(pattern)
 
-    results: list[Path] = []
     for p in iterator:
         if not p.is_file():
             continue
         if predicate and not predicate(p):
             continue
-        results.append(p)
-
-    return results
+        yield p
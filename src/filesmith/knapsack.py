@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from typing import Sequence
@@ -54,10 +54,12 @@ def run_knapsack(items: list[int], capacity: int) -> tuple[int, list[int]]:
     return best_sum, subset_indices
 
 
-def select_files_by_capacity(files: list[Path], capacity: int) -> tuple[int, list[Path]]:
+def select_files_by_capacity(files: Iterable[Path], capacity: int) -> tuple[int, list[Path]]:
     """
     Select a subset of files whose total size is closest to (but not exceeding) capacity.
     """
+    # The knapsack needs random access, so materialize lazy iterators here.
+    files = list(files)
     sizes = [f.stat().st_size for f in files]
     best_sum, indices = run_knapsack(sizes, capacity)
     selected_files = [files[i] for i in indices]
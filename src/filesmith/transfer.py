@@ -9,16 +9,160 @@ It copies or moves them with simple conflict policies.
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Sequence
+from typing import Iterable, Literal
+import errno
+import os
 import shutil
 
-TransferMode = Literal["copy", "move"]
+TransferMode = Literal["copy", "copy-fast", "move"]
 OnConflict = Literal["skip", "overwrite", "error"]
 
+# Per-call byte budget for os.copy_file_range.
+_COPY_CHUNK = 2 ** 30
+
+# Buffer size for the userspace fallback copy. 1 MiB dominates syscall
+# overhead on modern SSD/NVMe/NFS, versus shutil's 64 KiB default.
+_FALLBACK_BUFSIZE = 1 << 20
+
+# Transfers below this size are dominated by open/stat/close latency;
+# at or above it, by raw throughput. The two classes get differently
+# sized pools: wide to hide per-file latency, narrow to avoid making
+# the disk seek between large streams.
+_SMALL_FILE_MAX = 1 << 20
+_LARGE_POOL_WORKERS = 4
+
+# Destination roots this process has already created; repeated batch
+# calls against the same root then skip the mkdir (and its stat).
+_ensured_roots: set[Path] = set()
+
+
+def _ensure_dest_root(dest_root: Path) -> None:
+    if dest_root not in _ensured_roots:
+        dest_root.mkdir(parents=True, exist_ok=True)
+        _ensured_roots.add(dest_root)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int) -> None:
+    """
+    Move all bytes from `src_fd` to `dst_fd` without leaving the kernel.
+
+    Tries os.copy_file_range first (can become a reflink on CoW
+    filesystems), then os.sendfile, which still skips the userspace
+    bounce buffer but works across more filesystem pairs. Raises
+    OSError when neither primitive can serve this pair of files.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK):
+                pass
+            return
+        except OSError:
+            # Rewind and let sendfile retry from a clean slate.
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+
+    while os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK):
+        pass
+
+
+def _buffered_copy(fsrc, fdst) -> None:
+    """
+    Userspace read/write copy with one reusable 1 MiB buffer.
+
+    readinto fills the same bytearray on every iteration, so the loop
+    allocates nothing per chunk and makes ~16x fewer syscalls than
+    shutil's 64 KiB default buffer would.
+    """
+    buf = bytearray(_FALLBACK_BUFSIZE)
+    view = memoryview(buf)
+    while True:
+        n = fsrc.readinto(buf)
+        if not n:
+            break
+        fdst.write(view[:n])
+
+
+def _fadvise(fd: int, advice: int) -> None:
+    """Best-effort posix_fadvise; silently ignored where unsupported."""
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _fast_copy(src: Path, dest: Path) -> None:
+    """
+    Copy `src` to `dest` with copy2 semantics (contents + metadata).
+
+    The data moves via _kernel_copy, so the bytes never bounce through
+    a userspace buffer. When the zero-copy syscalls are missing or
+    refuse the pair, the same open files are reused for a buffered
+    userspace copy.
+
+    Where posix_fadvise exists, the source is hinted SEQUENTIAL for
+    aggressive readahead, and both files are hinted DONTNEED afterwards
+    so a bulk copy doesn't evict hotter data from the page cache.
+    """
+    has_fadvise = hasattr(os, "posix_fadvise")
+
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        if has_fadvise:
+            _fadvise(fsrc.fileno(), os.POSIX_FADV_SEQUENTIAL)
+        try:
+            _kernel_copy(fsrc.fileno(), fdst.fileno())
+        except (AttributeError, OSError):
+            # AttributeError: platform without os.sendfile (Windows).
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            _buffered_copy(fsrc, fdst)
+        if has_fadvise:
+            _fadvise(fsrc.fileno(), os.POSIX_FADV_DONTNEED)
+            fdst.flush()
+            _fadvise(fdst.fileno(), os.POSIX_FADV_DONTNEED)
+
+    shutil.copystat(src, dest)
+
+
+def _fast_move(src: Path, dest: Path) -> None:
+    """
+    Move `src` to `dest`, preferring an atomic same-filesystem rename.
+
+    os.replace is a single inode-table update when source and
+    destination share a filesystem — no data movement at all. Only
+    cross-device moves fall back to copy-and-delete, and that copy
+    goes through the same zero-copy path as mode="copy" instead of
+    shutil.move's buffered loop.
+    """
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        _fast_copy(src, dest)
+        os.unlink(src)
+
+
+def _run_batch(action, batch: list[tuple[Path, Path]], max_workers: int) -> None:
+    """
+    Run one class of transfers, threading only when it pays off.
+    """
+    if not batch:
+        return
+    if len(batch) == 1 or max_workers <= 1:
+        for src, dest in batch:
+            action(src, dest)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as executor:
+        for _ in executor.map(lambda pair: action(*pair), batch):
+            pass
+
 
 def transfer_files(
-    files: Sequence[Path],
+    files: Iterable[Path],
     dest_root: Path,
     mode: TransferMode = "copy",
     on_conflict: OnConflict = "skip",
@@ -29,12 +173,14 @@ def transfer_files(
 
     Parameters
     ----------
-    files : Sequence[Path]
-        Files to transfer.
+    files : Iterable[Path]
+        Files to transfer. May be a lazy iterator (e.g. from
+        finder.find_files); it is consumed exactly once.
     dest_root : Path
         Output directory (created if missing).
-    mode : {"copy", "move"}
-        Operation mode.
+    mode : {"copy", "copy-fast", "move"}
+        Operation mode. "copy-fast" copies contents only, skipping the
+        metadata (mtime/mode) preservation of "copy".
     on_conflict : {"skip", "overwrite", "error"}
         What to do when the destination file already exists.
     dry_run : bool
@@ -47,30 +193,64 @@ def transfer_files(
     """
 
     dest_root = Path(dest_root).expanduser()
-    dest_root.mkdir(parents=True, exist_ok=True)
+    _ensure_dest_root(dest_root)
 
+    if mode == "copy":
+        action = _fast_copy
+    elif mode == "copy-fast":
+        action = shutil.copyfile
+    elif mode == "move":
+        action = _fast_move
+    else:
+        raise ValueError(f"Invalid mode: {mode}")
+
+    # Resolve conflicts up front. `planned` stands in for files this very
+    # batch will create, matching the sequential dest.exists() semantics.
+    # "overwrite" transfers regardless of existence, so it skips the
+    # per-file stat entirely — the copy path already opens destinations
+    # with O_CREAT|O_TRUNC and needs no pre-check.
+    check_exists = on_conflict != "overwrite"
     ops: list[tuple[Path, Path]] = []
+    planned: set[Path] = set()
 
     for src in files:
         dest = dest_root / src.name
 
-        if dest.exists():
+        if dest in planned or (check_exists and dest.exists()):
             if on_conflict == "skip":
                 continue
             elif on_conflict == "error":
                 raise FileExistsError(f"Destination exists: {dest}")
             # else overwrite
 
+        planned.add(dest)
         ops.append((src, dest))
 
-        if dry_run:
-            continue
+    if dry_run or not ops:
+        return ops
+
+    # Transfers are independent, so run them on thread pools: the
+    # underlying copy/rename calls release the GIL, and parallelism
+    # keeps the device I/O queues full. Duplicate destinations (only
+    # possible with on_conflict="overwrite") must keep last-writer-wins
+    # order, so that rare case stays sequential.
+    if len(ops) == 1 or len(planned) != len(ops):
+        for src, dest in ops:
+            action(src, dest)
+    else:
+        # Latency-bound small files and throughput-bound large files
+        # get separate pools so neither class starves the other.
+        small_ops: list[tuple[Path, Path]] = []
+        large_ops: list[tuple[Path, Path]] = []
+        for op in ops:
+            try:
+                size = op[0].stat().st_size
+            except OSError:
+                # Let the transfer itself surface the error.
+                size = 0
+            (small_ops if size < _SMALL_FILE_MAX else large_ops).append(op)
 
-        if mode == "copy":
-            shutil.copy2(src, dest)
-        elif mode == "move":
-            shutil.move(src, dest)
-        else:
-            raise ValueError(f"Invalid mode: {mode}")
+        _run_batch(action, small_ops, min(32, 4 * (os.cpu_count() or 1)))
+        _run_batch(action, large_ops, _LARGE_POOL_WORKERS)
 
     return ops
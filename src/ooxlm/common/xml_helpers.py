@@ -0,0 +1,47 @@
+# src/ooxlm/common/xml_helpers.py
+
+"""
+Shared XML helpers for the OOXML editors.
+"""
+
+from __future__ import annotations
+
+from xml.etree import ElementTree as ET
+from zipfile import ZipFile
+
+# XML declaration written ahead of serialized documents. Emitting it
+# ourselves skips ElementTree's per-write declaration bookkeeping and
+# keeps the standalone attribute the OOXML originals carry, which
+# ET.ElementTree.write(xml_declaration=True) would drop.
+XML_PROLOG = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+
+def parse_member(zf: ZipFile, member: str) -> ET.Element:
+    """
+    Parse an XML member of an open ZIP archive into an Element.
+
+    The member is streamed through ZipFile.open straight into the
+    parser, so the decompressed XML is never materialized as one big
+    bytes object and inflate overlaps with parsing.
+
+    Parameters
+    ----------
+    zf : ZipFile
+        An open archive.
+    member : str
+        Internal path of the XML member (e.g. "word/document.xml").
+
+    Returns
+    -------
+    xml.etree.ElementTree.Element
+        Root element of the parsed tree.
+
+    Raises
+    ------
+    KeyError
+        If the member does not exist.
+    xml.etree.ElementTree.ParseError
+        If the member is not well-formed XML.
+    """
+    with zf.open(member) as f:
+        return ET.parse(f).getroot()
@@ -2,41 +2,158 @@
 
 from __future__ import annotations
 
+import struct
+import threading
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Mapping
-from zipfile import ZipFile, ZIP_DEFLATED
+from typing import BinaryIO, Callable, Iterable, Mapping, Union
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED, ZIP64_LIMIT
 
 PathLike = str | Path
 BytesMapping = Mapping[str, bytes]
 
+# Read helpers accept either a path (opened per call) or an
+# already-open ZipFile, so a sequence of reads can share one
+# central-directory parse.
+ZipSource = Union[PathLike, ZipFile]
 
-def list_members(zip_path: PathLike) -> list[str]:
+# A replacement is either ready-made bytes, or a writer callable that
+# streams the content into the (compressed) member file object.
+MemberWriter = Callable[[BinaryIO], None]
+ReplacementMapping = Mapping[str, Union[bytes, MemberWriter]]
+
+# Fixed portion of a ZIP local file header (APPNOTE.TXT section 4.3.7):
+# signature, versions/flags/method, dos time+date, crc, sizes, then the
+# filename and extra-field lengths we need to skip past.
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIG = b"PK\x03\x04"
+
+# One reusable 1 MiB copy buffer per thread: member copies refill it
+# via readinto instead of allocating a fresh bytes object per member.
+_COPY_BUFSIZE = 1 << 20
+_copy_buffers = threading.local()
+
+
+def _copy_buffer() -> memoryview:
+    buf = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = memoryview(bytearray(_COPY_BUFSIZE))
+        _copy_buffers.buf = buf
+    return buf
+
+
+def _copy_member_raw(zin: ZipFile, info: ZipInfo, zout: ZipFile) -> None:
     """
-    Return a list of all member names inside the ZIP archive.
+    Copy one member's already-compressed bytes from `zin` to `zout`.
+
+    The deflate stream is moved verbatim — no inflate, no re-deflate —
+    which is where almost all CPU goes when rebuilding an archive whose
+    members are mostly untouched. The central-directory ZipInfo already
+    carries the correct CRC and sizes, so only the local header needs
+    rewriting at the new offset.
+    """
+    fp = zin.fp
+    fp.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(fp.read(_LOCAL_HEADER.size))
+    if header[0] != _LOCAL_HEADER_SIG:
+        raise ValueError(f"Bad local header for member {info.filename!r}")
+    name_len, extra_len = header[9], header[10]
+    fp.seek(name_len + extra_len, 1)
+
+    zinfo = copy(info)
+    # CRC and sizes are written into the new local header directly, so
+    # the streaming data-descriptor flag no longer applies.
+    zinfo.flag_bits &= ~0x08
+    zout._writecheck(zinfo)
+    zout._didModify = True
+    zinfo.header_offset = zout.fp.tell()
+    zip64 = (
+        zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+    )
+    zout.fp.write(zinfo.FileHeader(zip64))
+
+    # Chunked copy through the per-thread buffer, so even huge members
+    # never exist in memory whole and the loop allocates nothing.
+    buf = _copy_buffer()
+    remaining = info.compress_size
+    while remaining:
+        n = fp.readinto(buf[: min(_COPY_BUFSIZE, remaining)])
+        if not n:
+            raise ValueError(
+                f"Truncated member data for {info.filename!r}"
+            )
+        zout.fp.write(buf[:n])
+        remaining -= n
+
+    zout.start_dir = zout.fp.tell()
+    zout.filelist.append(zinfo)
+    zout.NameToInfo[zinfo.filename] = zinfo
+
+
+def open_zip(zip_path: PathLike) -> ZipFile:
+    """
+    Open an archive for a sequence of read operations.
+
+    Use as a context manager and pass the handle to list_members /
+    load_member(s), so consecutive reads share one open and one
+    central-directory parse instead of re-seeking to the EOCD per call.
 
     Parameters
     ----------
     zip_path : str | Path
         Path to the .zip/.docx/.pptx file.
 
+    Returns
+    -------
+    ZipFile
+        The open archive (caller closes it, e.g. via `with`).
+    """
+    return ZipFile(Path(zip_path))
+
+
+@lru_cache(maxsize=256)
+def _cached_namelist(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    with ZipFile(path) as zf:
+        return tuple(zf.namelist())
+
+
+def list_members(zip_path: ZipSource) -> list[str]:
+    """
+    Return a list of all member names inside the ZIP archive.
+
+    The central-directory parse is memoized per (path, mtime, size), so
+    pipelines that enumerate the same unchanged archive repeatedly pay
+    one stat instead of an open + EOCD scan each time. Any modification
+    to the file invalidates the entry implicitly through the key.
+
+    Parameters
+    ----------
+    zip_path : str | Path | ZipFile
+        Path to the .zip/.docx/.pptx file, or an archive already
+        opened via open_zip.
+
     Returns
     -------
     list[str]
         List of member paths (e.g. "word/document.xml").
     """
+    if isinstance(zip_path, ZipFile):
+        return zip_path.namelist()
     zip_path = Path(zip_path)
-    with ZipFile(zip_path) as zf:
-        return zf.namelist()
+    st = zip_path.stat()
+    return list(_cached_namelist(str(zip_path), st.st_mtime_ns, st.st_size))
 
 
-def load_member(zip_path: PathLike, member: str) -> bytes:
+def load_member(zip_path: ZipSource, member: str) -> bytes:
     """
     Load a single member from the ZIP archive as raw bytes.
 
     Parameters
     ----------
-    zip_path : str | Path
-        Path to the .zip/.docx/.pptx file.
+    zip_path : str | Path | ZipFile
+        Path to the .zip/.docx/.pptx file, or an archive already
+        opened via open_zip.
     member : str
         Internal path inside the archive (e.g. "word/document.xml").
 
@@ -50,19 +167,21 @@ def load_member(zip_path: PathLike, member: str) -> bytes:
     KeyError
         If the member does not exist.
     """
-    zip_path = Path(zip_path)
-    with ZipFile(zip_path) as zf:
+    if isinstance(zip_path, ZipFile):
+        return zip_path.read(member)
+    with ZipFile(Path(zip_path)) as zf:
         return zf.read(member)
 
 
-def load_members(zip_path: PathLike, members: Iterable[str]) -> dict[str, bytes]:
+def load_members(zip_path: ZipSource, members: Iterable[str]) -> dict[str, bytes]:
     """
     Load multiple members from the ZIP archive.
 
     Parameters
     ----------
-    zip_path : str | Path
-        Path to the .zip/.docx/.pptx file.
+    zip_path : str | Path | ZipFile
+        Path to the .zip/.docx/.pptx file, or an archive already
+        opened via open_zip.
     members : Iterable[str]
         Internal paths inside the archive.
 
@@ -75,41 +194,79 @@ def load_members(zip_path: PathLike, members: Iterable[str]) -> dict[str, bytes]
     -----
     This will raise KeyError if any member is missing.
     """
-    zip_path = Path(zip_path)
+    if isinstance(zip_path, ZipFile):
+        return {name: zip_path.read(name) for name in members}
     result: dict[str, bytes] = {}
-    with ZipFile(zip_path) as zf:
+    with ZipFile(Path(zip_path)) as zf:
         for name in members:
             result[name] = zf.read(name)
     return result
 
 
-def load_all(zip_path: PathLike) -> dict[str, bytes]:
+def load_all(zip_path: ZipSource) -> dict[str, bytes]:
     """
     Load all members from the ZIP archive into memory.
 
     Parameters
     ----------
-    zip_path : str | Path
-        Path to the .zip/.docx/.pptx file.
+    zip_path : str | Path | ZipFile
+        Path to the .zip/.docx/.pptx file, or an archive already
+        opened via open_zip.
 
     Returns
     -------
     dict[str, bytes]
         Mapping {member_name: content_bytes}.
     """
-    zip_path = Path(zip_path)
+    if isinstance(zip_path, ZipFile):
+        return {info.filename: zip_path.read(info.filename)
+                for info in zip_path.infolist()}
     result: dict[str, bytes] = {}
-    with ZipFile(zip_path) as zf:
+    with ZipFile(Path(zip_path)) as zf:
         for info in zf.infolist():
             result[info.filename] = zf.read(info.filename)
     return result
 
 
+# Payloads deflate can't shrink: blobs smaller than the deflate header
+# overhead, and container formats that are already compressed (ZIP,
+# gzip, PNG). Storing them skips the compressor for zero size cost.
+_STORED_MAX = 64
+_COMPRESSED_MAGICS = (b"PK\x03\x04", b"\x1f\x8b", b"\x89PNG")
+
+
+def _best_compress_type(data: bytes) -> int:
+    if len(data) < _STORED_MAX or data.startswith(_COMPRESSED_MAGICS):
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def _write_member(zout: ZipFile, name_or_info, value) -> None:
+    """
+    Write one member from either bytes or a streaming writer callable.
+
+    Bytes payloads pick their compression from _best_compress_type;
+    streamed payloads keep the member's (or archive's) configured type,
+    since their content isn't known up front.
+    """
+    if callable(value):
+        with zout.open(name_or_info, mode="w") as f:
+            value(f)
+    elif isinstance(name_or_info, ZipInfo):
+        zinfo = copy(name_or_info)
+        zinfo.compress_type = _best_compress_type(value)
+        zout.writestr(zinfo, value)
+    else:
+        zout.writestr(
+            name_or_info, value, compress_type=_best_compress_type(value)
+        )
+
+
 def rewrite_zip(
     zip_path: PathLike,
     output_path: PathLike,
     *,
-    replacements: BytesMapping,
+    replacements: ReplacementMapping,
     drop: Iterable[str] | None = None,
 ) -> None:
     """
@@ -126,8 +283,11 @@ def rewrite_zip(
         Path to the source .zip/.docx/.pptx file.
     output_path : str | Path
         Path to the destination file.
-    replacements : Mapping[str, bytes]
-        Mapping of {member_name: new_content_bytes}.
+    replacements : Mapping[str, bytes | Callable[[BinaryIO], None]]
+        Mapping of {member_name: new_content}.
+        A value may be ready-made bytes, or a callable that receives a
+        writable file object and streams the content into it (so large
+        members never need to be materialized in memory).
         If a key exists in the original archive, its content is replaced.
         If a key does NOT exist in the original, it will be ADDED as a new file.
     drop : Iterable[str] | None, optional
@@ -157,20 +317,85 @@ def rewrite_zip(
                 continue
 
             if name in replacements:
-                data = replacements[name]
                 handled.add(name)
+                # Preserve original metadata (ZipInfo) where possible
+                _write_member(zout, info, replacements[name])
             else:
-                data = zin.read(name)
-
-            # Preserve original metadata (ZipInfo) where possible
-            zout.writestr(info, data)
+                # Untouched member: move the compressed stream verbatim
+                # instead of paying inflate + deflate for a byte-exact
+                # round trip.
+                _copy_member_raw(zin, info, zout)
 
         # Add any replacement entries that did not exist in original
-        for name, data in replacements.items():
+        for name, value in replacements.items():
             if name in handled:
                 continue
             # New member with default metadata
-            zout.writestr(name, data)
+            _write_member(zout, name, value)
+
+
+def rewrite_zip_inplace(
+    zip_path: PathLike,
+    *,
+    replacements: ReplacementMapping,
+    drop: Iterable[str] | None = None,
+) -> None:
+    """
+    Edit a ZIP archive in place by appending the changed members.
+
+    Replaced and added members are written after the existing data, and
+    the central directory is rebuilt to omit dropped and superseded
+    entries. Untouched member bytes are never read or rewritten, so the
+    archive grows by the size of the delta instead of being copied
+    whole — the classic ZIP append trick.
+
+    Parameters
+    ----------
+    zip_path : str | Path
+        Path to the archive to edit. Modified in place.
+    replacements : Mapping[str, bytes | Callable[[BinaryIO], None]]
+        Same semantics as in rewrite_zip.
+    drop : Iterable[str] | None, optional
+        Iterable of member names to unlink from the central directory.
+
+    Notes
+    -----
+    The bytes of dropped/superseded members stay in the file, merely
+    unreferenced; repeated edits therefore accumulate dead space. Run
+    the archive through rewrite_zip (or copy_zip) to compact it.
+    """
+    path = Path(zip_path)
+    to_drop = set(drop or [])
+
+    with ZipFile(path, "a", compression=ZIP_DEFLATED) as zf:
+        old_infos = {info.filename: info for info in zf.filelist}
+
+        # Prune superseded and dropped entries from the central
+        # directory that will be rewritten on close (before appending,
+        # so zipfile's duplicate-name check stays quiet).
+        stale_names = to_drop | set(replacements)
+        stale = {
+            id(info)
+            for name, info in old_infos.items()
+            if name in stale_names
+        }
+        zf.filelist = [info for info in zf.filelist if id(info) not in stale]
+        for name in stale_names:
+            if name in old_infos and zf.NameToInfo.get(name) is old_infos[name]:
+                del zf.NameToInfo[name]
+        # Force the central directory rewrite even for a pure drop.
+        zf._didModify = True
+
+        for name, value in replacements.items():
+            orig = old_infos.get(name)
+            if orig is not None:
+                # Preserve the original metadata; sizes/CRC are
+                # recomputed as the new content is written.
+                zinfo = copy(orig)
+                zinfo.flag_bits &= ~0x08
+                _write_member(zf, zinfo, value)
+            else:
+                _write_member(zf, name, value)
 
 
 def copy_zip(src: PathLike, dst: PathLike) -> None:
@@ -195,5 +420,4 @@ def copy_zip(src: PathLike, dst: PathLike) -> None:
 
     with ZipFile(src) as zin, ZipFile(dst, "w", compression=ZIP_DEFLATED) as zout:
         for info in zin.infolist():
-            data = zin.read(info.filename)
-            zout.writestr(info, data)
+            _copy_member_raw(zin, info, zout)
@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import Sequence
 from xml.etree import ElementTree as ET
 
-from ooxlm.common.zip_ops import load_member, rewrite_zip
+try:
+    # ElementTree transparently uses the _elementtree C accelerator;
+    # fail loudly if only the pure-Python fallback is available, since
+    # it is an order of magnitude slower on real documents.
+    import _elementtree  # noqa: F401
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "ooxlm requires the C-accelerated ElementTree (_elementtree)"
+    ) from exc
+
+from zipfile import ZipFile
+
+from ooxlm.common.xml_helpers import XML_PROLOG, parse_member
+from ooxlm.common.zip_ops import rewrite_zip
+from ooxlm.docx.xml_utils import T_TAG
 
 PathLike = str | Path
 
@@ -37,6 +53,7 @@ class SimpleDocxEditor:
         """
         self.path = Path(path)
         self._xml_root = self._load_document_xml()
+        self._text_nodes: list[ET.Element] | None = None
 
     # --------------------------------------------------------------------- #
     # Internal helpers
@@ -60,15 +77,16 @@ class SimpleDocxEditor:
         if not self.path.is_file():
             raise FileNotFoundError(f"DOCX file not found: {self.path}")
 
+        # Stream the member straight into the parser: expat consumes
+        # the inflate output chunk by chunk, so the decompressed XML is
+        # never materialized as one big bytes object.
         try:
-            xml_bytes = load_member(self.path, DOCUMENT_XML)
+            with ZipFile(self.path) as zf:
+                return parse_member(zf, DOCUMENT_XML)
         except KeyError as exc:
             raise RuntimeError(
                 f"{DOCUMENT_XML!r} not found in DOCX archive: {self.path}"
             ) from exc
-
-        try:
-            return ET.fromstring(xml_bytes)
         except ET.ParseError as exc:
             raise RuntimeError(
                 f"Failed to parse {DOCUMENT_XML!r} from DOCX: {self.path}"
@@ -78,23 +96,42 @@ class SimpleDocxEditor:
         """
         Iterate over all w:t nodes in the document.
 
-        This keeps namespace handling extremely simple by checking
-        tag suffixes only ('.endswith(\"}t\")'), which works because
-        DOCX uses qualified names like '{namespace}t' for w:t.
+        Passing the qualified tag to Element.iter() lets the C
+        accelerator filter nodes during traversal, instead of visiting
+        every element and testing its tag in Python.
+        """
+        return self._xml_root.iter(T_TAG)
+
+    def _text_nodes_cached(self) -> list[ET.Element]:
+        """
+        All w:t nodes, collected once per editor.
+
+        get_text() and replace() only read or mutate node text, never
+        the tree structure, so the cached element references stay valid
+        for the editor's lifetime and repeat calls skip the traversal.
         """
-        for node in self._xml_root.iter():
-            if node.tag.endswith("}t"):  # w:t
-                yield node
+        if self._text_nodes is None:
+            self._text_nodes = list(self._iter_text_nodes())
+        return self._text_nodes
 
     # --------------------------------------------------------------------- #
     # Public API
     # --------------------------------------------------------------------- #
-    def get_text(self, separator: str = "") -> str:
+    @classmethod
+    def extract_text(cls, path: PathLike, separator: str = "") -> str:
         """
-        Return concatenated text from all text nodes in the document.
+        Extract visible text from a DOCX file without building a tree.
+
+        This is the cheap read-only path: word/document.xml is scanned
+        with ET.iterparse and each element is discarded as soon as its
+        end tag is seen, so peak memory stays bounded by a single
+        element regardless of document size. Use an editor instance
+        only when the document will also be modified.
 
         Parameters
         ----------
+        path : str | Path
+            Path to the .docx file.
         separator : str, optional
             String used to join individual text nodes. Defaults to "".
 
@@ -102,13 +139,55 @@ class SimpleDocxEditor:
         -------
         str
             Combined visible text (very naive; no layout awareness).
+
+        Raises
+        ------
+        FileNotFoundError
+            If the DOCX file does not exist.
+        RuntimeError
+            If word/document.xml is missing or invalid.
         """
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"DOCX file not found: {path}")
+
         texts: list[str] = []
-        for node in self._iter_text_nodes():
-            if node.text:
-                texts.append(node.text)
+        try:
+            with ZipFile(path) as zf, zf.open(DOCUMENT_XML) as f:
+                for _event, elem in ET.iterparse(f, events=("end",)):
+                    if elem.tag == T_TAG and elem.text:
+                        texts.append(elem.text)
+                    elem.clear()
+        except KeyError as exc:
+            raise RuntimeError(
+                f"{DOCUMENT_XML!r} not found in DOCX archive: {path}"
+            ) from exc
+        except ET.ParseError as exc:
+            raise RuntimeError(
+                f"Failed to parse {DOCUMENT_XML!r} from DOCX: {path}"
+            ) from exc
         return separator.join(texts)
 
+    def get_text(self, separator: str = "") -> str:
+        """
+        Return concatenated text from all text nodes in the document.
+
+        Parameters
+        ----------
+        separator : str, optional
+            String used to join individual text nodes. Defaults to "".
+
+        Returns
+        -------
+        str
+            Combined visible text (very naive; no layout awareness).
+        """
+        # filter(None, ...) drops empty/None texts in C, and str.join
+        # consumes the iterator in C too — no per-node Python bytecode.
+        return separator.join(
+            filter(None, (node.text for node in self._text_nodes_cached()))
+        )
+
     def replace(self, old: str, new: str) -> int:
         """
         Naively replace text in all w:t nodes.
@@ -134,13 +213,48 @@ class SimpleDocxEditor:
             return 0
 
         changed_nodes = 0
-        for node in self._iter_text_nodes():
-            if not node.text:
+        for node in self._text_nodes_cached():
+            text = node.text
+            # Containment check first: most nodes don't match, and this
+            # skips the allocation + compare that replace() would cost.
+            if not text or old not in text:
+                continue
+            node.text = text.replace(old, new)
+            changed_nodes += 1
+        return changed_nodes
+
+    def replace_many(self, pairs: Sequence[tuple[str, str]]) -> int:
+        """
+        Apply several replacements in a single pass over the text nodes.
+
+        This is the preferred bulk API: all (old, new) pairs are
+        combined into one alternation pattern, so each w:t node is
+        scanned once for N replacements instead of N times.
+
+        Parameters
+        ----------
+        pairs : Sequence[tuple[str, str]]
+            (old, new) replacement pairs. Empty search strings are
+            ignored; if the same `old` appears twice, the last pair
+            wins.
+
+        Returns
+        -------
+        int
+            Number of text nodes that were modified.
+        """
+        table = {old: new for old, new in pairs if old}
+        if not table:
+            return 0
+
+        pattern = re.compile("|".join(re.escape(old) for old in table))
+        changed_nodes = 0
+        for node in self._text_nodes_cached():
+            text = node.text
+            if not text or pattern.search(text) is None:
                 continue
-            new_text = node.text.replace(old, new)
-            if new_text != node.text:
-                node.text = new_text
-                changed_nodes += 1
+            node.text = pattern.sub(lambda m: table[m.group(0)], text)
+            changed_nodes += 1
         return changed_nodes
 
     def save(self, output_path: PathLike) -> None:
@@ -156,19 +270,20 @@ class SimpleDocxEditor:
         -----
         This rebuilds the DOCX ZIP archive, replacing only
         'word/document.xml' and copying all other members as-is.
+        The XML is serialized straight into the archive's deflate
+        stream, so the document never exists as one big bytes object.
         """
         output_path = Path(output_path)
 
-        # Serialize updated XML tree
-        new_xml_bytes = ET.tostring(
-            self._xml_root,
-            encoding="utf-8",
-            xml_declaration=True,
-        )
+        def write_document(f) -> None:
+            f.write(XML_PROLOG)
+            ET.ElementTree(self._xml_root).write(
+                f, encoding="utf-8", xml_declaration=False
+            )
 
         # Rebuild DOCX using the shared ZIP helper
         rewrite_zip(
             self.path,
             output_path,
-            replacements={DOCUMENT_XML: new_xml_bytes},
+            replacements={DOCUMENT_XML: write_document},
         )
@@ -9,14 +9,23 @@ These are intentionally tiny to avoid overcommitting the API
 while allowing clean future expansion.
 """
 
+import sys
+
 W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
 
+# Fully qualified tags, precomputed once so hot loops compare against a
+# constant instead of concatenating per call. Interned so that tags
+# sharing the interpreter's string cache compare by pointer identity.
+T_TAG = sys.intern(W_NS + "t")
+P_TAG = sys.intern(W_NS + "p")
+
 
 def is_text_node(node) -> bool:
     """Return True if the XML Element is a w:t node."""
-    return node.tag == W_NS + "t"
+    # Identity fast path; == fallback covers non-interned tag strings.
+    return node.tag is T_TAG or node.tag == T_TAG
 
 
 def is_paragraph(node) -> bool:
     """Return True if the Element is a w:p node."""
-    return node.tag == W_NS + "p"
+    return node.tag is P_TAG or node.tag == P_TAG
@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import Sequence
 from xml.etree import ElementTree as ET
 
-from ooxlm.common.zip_ops import list_members, load_member, rewrite_zip
+try:
+    # ElementTree transparently uses the _elementtree C accelerator;
+    # fail loudly if only the pure-Python fallback is available, since
+    # it is an order of magnitude slower on real documents.
+    import _elementtree  # noqa: F401
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "ooxlm requires the C-accelerated ElementTree (_elementtree)"
+    ) from exc
+from zipfile import ZipFile
+
+from ooxlm.common.xml_helpers import XML_PROLOG, parse_member
+from ooxlm.common.zip_ops import rewrite_zip
+from ooxlm.pptx.xml_utils import T_TAG
 
 PathLike = str | Path
 
@@ -14,6 +29,31 @@ SLIDE_BASENAME = "slide"
 SLIDE_EXT = ".xml"
 
 
+def _slide_names(zf: ZipFile) -> list[str]:
+    """
+    Member names of all slide XMLs in an open archive, in slide order.
+
+    Slides sort numerically, so slide10.xml comes after slide2.xml
+    (lexicographic sort got this wrong).
+    """
+    # "ppt/slides/slide<number>.xml"
+    prefix = SLIDES_PREFIX + SLIDE_BASENAME
+    start, stop = len(prefix), -len(SLIDE_EXT)
+
+    def slide_key(name: str):
+        stem = name[start:stop]
+        return (0, int(stem)) if stem.isdigit() else (1, stem)
+
+    return sorted(
+        (
+            name
+            for name in zf.namelist()
+            if name.startswith(prefix) and name.endswith(SLIDE_EXT)
+        ),
+        key=slide_key,
+    )
+
+
 class SimplePptxEditor:
     """
     Minimalistic PPTX text editor using Python stdlib only.
@@ -39,6 +79,7 @@ class SimplePptxEditor:
         """
         self.path = Path(path)
         self._slides: dict[str, ET.Element] = {}
+        self._text_nodes: list[ET.Element] | None = None
         self._load_slides()
 
     # ------------------------------------------------------------------ #
@@ -54,44 +95,106 @@ class SimplePptxEditor:
         if not self.path.is_file():
             raise FileNotFoundError(f"PPTX file not found: {self.path}")
 
-        members = list_members(self.path)
-
-        slide_names = sorted(
-            name
-            for name in members
-            if name.startswith(SLIDES_PREFIX)
-            and name[len(SLIDES_PREFIX):].startswith(SLIDE_BASENAME)
-            and name.endswith(SLIDE_EXT)
-        )
+        # One archive open serves member discovery and all slide reads,
+        # so the ZIP central directory is parsed once instead of once
+        # per slide. Each slide is streamed straight into the parser:
+        # expat consumes the inflate output chunk by chunk, so no slide
+        # is ever materialized as one big bytes object.
+        with ZipFile(self.path) as zf:
+            slide_names = _slide_names(zf)
 
-        if not slide_names:
-            raise RuntimeError(f"No slide XMLs found in PPTX: {self.path}")
-
-        slides: dict[str, ET.Element] = {}
-        for name in slide_names:
-            xml_bytes = load_member(self.path, name)
-            try:
-                root = ET.fromstring(xml_bytes)
-            except ET.ParseError as exc:
-                raise RuntimeError(
-                    f"Failed to parse slide XML {name!r} in PPTX: {self.path}"
-                ) from exc
-            slides[name] = root
+            if not slide_names:
+                raise RuntimeError(f"No slide XMLs found in PPTX: {self.path}")
 
+            slides: dict[str, ET.Element] = {}
+            for name in slide_names:
+                try:
+                    slides[name] = parse_member(zf, name)
+                except ET.ParseError as exc:
+                    raise RuntimeError(
+                        f"Failed to parse slide XML {name!r} in PPTX: {self.path}"
+                    ) from exc
         self._slides = slides
 
     def _iter_text_nodes(self):
         """
-        Iterate over all w:t nodes across all slides.
+        Iterate over all a:t nodes across all slides.
+
+        Passing the qualified tag to Element.iter() lets the C
+        accelerator filter nodes during traversal, instead of visiting
+        every element and testing its tag in Python.
         """
         for root in self._slides.values():
-            for node in root.iter():
-                if node.tag.endswith("}t"):  # w:t
-                    yield node
+            yield from root.iter(T_TAG)
+
+    def _text_nodes_cached(self) -> list[ET.Element]:
+        """
+        All a:t nodes across all slides, collected once per editor.
+
+        get_text() and replace() only read or mutate node text, never
+        the tree structure, so the cached element references stay valid
+        for the editor's lifetime and repeat calls skip the traversal.
+        """
+        if self._text_nodes is None:
+            self._text_nodes = list(self._iter_text_nodes())
+        return self._text_nodes
 
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
+    @classmethod
+    def extract_text(cls, path: PathLike, separator: str = " ") -> str:
+        """
+        Extract visible text from a PPTX file without building trees.
+
+        This is the cheap read-only path: each slide XML is scanned
+        with ET.iterparse and each element is discarded as soon as its
+        end tag is seen, so peak memory stays bounded by a single
+        element regardless of deck size. Use an editor instance only
+        when slides will also be modified.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the .pptx file.
+        separator : str, optional
+            String used to join individual text nodes. Defaults to " ".
+
+        Returns
+        -------
+        str
+            Combined visible text (very naive; no layout awareness).
+
+        Raises
+        ------
+        FileNotFoundError
+            If the PPTX file does not exist.
+        RuntimeError
+            If no slide XMLs are present or one is invalid.
+        """
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"PPTX file not found: {path}")
+
+        texts: list[str] = []
+        with ZipFile(path) as zf:
+            slide_names = _slide_names(zf)
+            if not slide_names:
+                raise RuntimeError(f"No slide XMLs found in PPTX: {path}")
+
+            for name in slide_names:
+                try:
+                    with zf.open(name) as f:
+                        for _event, elem in ET.iterparse(f, events=("end",)):
+                            if elem.tag == T_TAG and elem.text:
+                                texts.append(elem.text)
+                            elem.clear()
+                except ET.ParseError as exc:
+                    raise RuntimeError(
+                        f"Failed to parse slide XML {name!r} in PPTX: {path}"
+                    ) from exc
+        return separator.join(texts)
+
     def get_text(self, separator: str = " ") -> str:
         """
         Return concatenated text from all slides.
@@ -107,11 +210,11 @@ class SimplePptxEditor:
         str
             Combined visible text (very naive; no layout awareness).
         """
-        texts: list[str] = []
-        for node in self._iter_text_nodes():
-            if node.text:
-                texts.append(node.text)
-        return separator.join(texts)
+        # filter(None, ...) drops empty/None texts in C, and str.join
+        # consumes the iterator in C too — no per-node Python bytecode.
+        return separator.join(
+            filter(None, (node.text for node in self._text_nodes_cached()))
+        )
 
     def replace(self, old: str, new: str) -> int:
         """
@@ -133,13 +236,48 @@ class SimplePptxEditor:
             return 0
 
         changed_nodes = 0
-        for node in self._iter_text_nodes():
-            if not node.text:
+        for node in self._text_nodes_cached():
+            text = node.text
+            # Containment check first: most nodes don't match, and this
+            # skips the allocation + compare that replace() would cost.
+            if not text or old not in text:
                 continue
-            new_text = node.text.replace(old, new)
-            if new_text != node.text:
-                node.text = new_text
-                changed_nodes += 1
+            node.text = text.replace(old, new)
+            changed_nodes += 1
+        return changed_nodes
+
+    def replace_many(self, pairs: Sequence[tuple[str, str]]) -> int:
+        """
+        Apply several replacements in a single pass over all slides.
+
+        This is the preferred bulk API: all (old, new) pairs are
+        combined into one alternation pattern, so each a:t node is
+        scanned once for N replacements instead of N times.
+
+        Parameters
+        ----------
+        pairs : Sequence[tuple[str, str]]
+            (old, new) replacement pairs. Empty search strings are
+            ignored; if the same `old` appears twice, the last pair
+            wins.
+
+        Returns
+        -------
+        int
+            Number of text nodes that were modified.
+        """
+        table = {old: new for old, new in pairs if old}
+        if not table:
+            return 0
+
+        pattern = re.compile("|".join(re.escape(old) for old in table))
+        changed_nodes = 0
+        for node in self._text_nodes_cached():
+            text = node.text
+            if not text or pattern.search(text) is None:
+                continue
+            node.text = pattern.sub(lambda m: table[m.group(0)], text)
+            changed_nodes += 1
         return changed_nodes
 
     def save(self, output_path: PathLike) -> None:
@@ -155,16 +293,22 @@ class SimplePptxEditor:
         -----
         This rebuilds the PPTX ZIP archive, replacing only
         'ppt/slides/slide*.xml' and copying all other members as-is.
+        Each slide is serialized straight into the archive's deflate
+        stream, so no slide ever exists as one big bytes object.
         """
         output_path = Path(output_path)
 
-        replacements: dict[str, bytes] = {}
-        for name, root in self._slides.items():
-            replacements[name] = ET.tostring(
-                root,
-                encoding="utf-8",
-                xml_declaration=True,
-            )
+        def slide_writer(root: ET.Element):
+            def write(f) -> None:
+                f.write(XML_PROLOG)
+                ET.ElementTree(root).write(
+                    f, encoding="utf-8", xml_declaration=False
+                )
+            return write
+
+        replacements = {
+            name: slide_writer(root) for name, root in self._slides.items()
+        }
 
         rewrite_zip(
             self.path,
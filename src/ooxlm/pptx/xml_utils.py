@@ -6,9 +6,17 @@ Provides:
     - small helpers for checking text nodes
 """
 
+import sys
+
 A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
 
+# Fully qualified tag, precomputed once so hot loops compare against a
+# constant instead of concatenating per call. Interned so that tags
+# sharing the interpreter's string cache compare by pointer identity.
+T_TAG = sys.intern(A_NS + "t")
+
 
 def is_text_node(node) -> bool:
     """Return True if the XML Element is an a:t node."""
-    return node.tag == A_NS + "t"
+    # Identity fast path; == fallback covers non-interned tag strings.
+    return node.tag is T_TAG or node.tag == T_TAG
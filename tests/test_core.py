@@ -22,21 +22,6 @@ class TestCopyFiles(unittest.TestCase):
         self.origin = tempfile.mkdtemp()
         self.destination = tempfile.mkdtemp()
 
-        # Create test files in the origin directory
-        self.files = ["test1.txt", "test2.log", "example.txt", "readme.md"]
-        for file_name in self.files:
-            with open(os.path.join(self.origin, file_name), "w") as f:
-                f.write("Sample content")
-
-        # Modify the mtime for some files
-        self.old_file = os.path.join(self.origin, "test1.txt")
-        old_mtime = datetime.now() - timedelta(days=2)
-        os.utime(self.old_file, (old_mtime.timestamp(), old_mtime.timestamp()))
-
-        self.new_file = os.path.join(self.origin, "example.txt")
-        new_mtime = datetime.now() - timedelta(hours=1)
-        os.utime(self.new_file, (new_mtime.timestamp(), new_mtime.timestamp()))
-
         # Create test files in the origin directory
         self.files = ["test1.txt", "test2.log", "example.txt", "readme.md"]
         for file_name in self.files:
@@ -38,7 +38,7 @@ def test_find_files_predicate(tmp_path: Path):
     def pred(path: Path):
         return path.read_text().startswith("h")
 
-    results = find_files(tmp_path, pattern="*.txt", predicate=pred)
+    results = list(find_files(tmp_path, pattern="*.txt", predicate=pred))
 
     assert len(results) == 1
     assert results[0].name == "x.txt"
@@ -75,3 +75,24 @@ def test_init_raises_on_missing_document_xml(tmp_path: Path) -> None:
 
     with pytest.raises(RuntimeError):
         SimpleDocxEditor(path)
+
+
+def test_extract_text_matches_editor_get_text(tmp_path: Path) -> None:
+    docx_path = tmp_path / "extract.docx"
+    create_minimal_docx(docx_path)
+
+    text = SimpleDocxEditor.extract_text(docx_path)
+
+    assert text == "Hello world"
+    assert text == SimpleDocxEditor(docx_path).get_text()
+
+
+def test_replace_many_applies_all_pairs_in_one_pass(tmp_path: Path) -> None:
+    docx_path = tmp_path / "pairs.docx"
+    create_minimal_docx(docx_path)
+
+    editor = SimpleDocxEditor(docx_path)
+    changed_nodes = editor.replace_many([("Hello", "Goodbye"), ("world", "DOCX")])
+
+    assert changed_nodes == 2
+    assert editor.get_text() == "Goodbye DOCX"
@@ -106,3 +106,25 @@ def test_init_raises_on_no_slides(tmp_path: Path) -> None:
 
     with pytest.raises(RuntimeError):
         SimplePptxEditor(path)
+
+
+def test_extract_text_matches_editor_get_text(tmp_path: Path) -> None:
+    pptx_path = tmp_path / "extract.pptx"
+    create_minimal_pptx(pptx_path)
+
+    text = SimplePptxEditor.extract_text(pptx_path)
+
+    assert text == SimplePptxEditor(pptx_path).get_text()
+
+
+def test_replace_many_applies_all_pairs_in_one_pass(tmp_path: Path) -> None:
+    pptx_path = tmp_path / "pairs.pptx"
+    create_minimal_pptx(pptx_path)
+
+    editor = SimplePptxEditor(pptx_path)
+    changed_nodes = editor.replace_many([("Hello", "Hi"), ("slide", "deck")])
+
+    assert changed_nodes == 2
+    text = editor.get_text(separator=" ")
+    assert "Hi" in text
+    assert "deck" in text
@@ -8,7 +8,9 @@ from zipfile import ZipFile
 from ooxlm.common.zip_ops import (
     list_members,
     load_member,
+    open_zip,
     rewrite_zip,
+    rewrite_zip_inplace,
 )
 
 
@@ -60,3 +62,104 @@ def test_rewrite_zip_replaces_drops_and_adds(tmp_path: Path) -> None:
     assert load_member(dst, "a.txt") == b"A"
     assert load_member(dst, "b.txt") == b"B2"
     assert load_member(dst, "new.txt") == b"NEW"
+
+
+def test_read_helpers_accept_an_open_archive(tmp_path: Path) -> None:
+    path = tmp_path / "shared.zip"
+    _create_sample_zip(path)
+
+    # One open serves enumeration and all reads.
+    with open_zip(path) as zf:
+        assert set(list_members(zf)) == {"a.txt", "b.txt", "c.txt"}
+        assert load_member(zf, "a.txt") == b"A"
+        assert load_member(zf, "b.txt") == b"B"
+
+
+def test_list_members_cache_sees_archive_changes(tmp_path: Path) -> None:
+    path = tmp_path / "changing.zip"
+    _create_sample_zip(path)
+
+    assert set(list_members(path)) == {"a.txt", "b.txt", "c.txt"}
+
+    # The memoized central directory must refresh once the file changes.
+    rewrite_zip_inplace(path, replacements={"d.txt": b"D"})
+    assert set(list_members(path)) == {"a.txt", "b.txt", "c.txt", "d.txt"}
+
+
+def test_rewrite_zip_passes_untouched_members_through_raw(tmp_path: Path) -> None:
+    src = tmp_path / "src.zip"
+    dst = tmp_path / "dst.zip"
+    _create_sample_zip(src)
+
+    rewrite_zip(src, dst, replacements={"b.txt": b"B2"})
+
+    # Untouched members keep their exact compressed form and metadata.
+    with ZipFile(src) as zsrc, ZipFile(dst) as zdst:
+        assert zdst.testzip() is None
+        for name in ("a.txt", "c.txt"):
+            src_info = zsrc.getinfo(name)
+            dst_info = zdst.getinfo(name)
+            assert dst_info.CRC == src_info.CRC
+            assert dst_info.compress_size == src_info.compress_size
+            assert dst_info.compress_type == src_info.compress_type
+        assert zdst.read("a.txt") == b"A"
+        assert zdst.read("c.txt") == b"C"
+
+
+def test_rewrite_zip_stores_incompressible_replacements(tmp_path: Path) -> None:
+    from zipfile import ZIP_STORED
+
+    src = tmp_path / "src.zip"
+    dst = tmp_path / "dst.zip"
+    _create_sample_zip(src)
+
+    rewrite_zip(src, dst, replacements={"b.txt": b"B2"})
+
+    # Tiny payloads skip deflate: the header overhead alone would make
+    # the stored form smaller.
+    with ZipFile(dst) as zf:
+        info = zf.getinfo("b.txt")
+        assert info.compress_type == ZIP_STORED
+        assert zf.read("b.txt") == b"B2"
+
+
+def test_rewrite_zip_inplace_replaces_drops_and_adds(tmp_path: Path) -> None:
+    path = tmp_path / "edit.zip"
+    _create_sample_zip(path)
+
+    rewrite_zip_inplace(
+        path,
+        replacements={
+            "b.txt": b"B2",
+            "new.txt": b"NEW",
+        },
+        drop=["c.txt"],
+    )
+
+    with ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert set(zf.namelist()) == {"a.txt", "b.txt", "new.txt"}
+        assert zf.read("a.txt") == b"A"
+        assert zf.read("b.txt") == b"B2"
+        assert zf.read("new.txt") == b"NEW"
+
+
+def test_rewrite_zip_accepts_streaming_writers(tmp_path: Path) -> None:
+    src = tmp_path / "src.zip"
+    dst = tmp_path / "dst.zip"
+    _create_sample_zip(src)
+
+    # Replace one member and add one, both via writer callables that
+    # stream bytes into the member file object.
+    rewrite_zip(
+        src,
+        dst,
+        replacements={
+            "b.txt": lambda f: f.write(b"B-streamed"),
+            "new.txt": lambda f: f.write(b"NEW-streamed"),
+        },
+    )
+
+    assert load_member(dst, "a.txt") == b"A"
+    assert load_member(dst, "b.txt") == b"B-streamed"
+    assert load_member(dst, "new.txt") == b"NEW-streamed"